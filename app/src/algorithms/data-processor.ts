@@ -155,13 +155,22 @@ export const parseAuthorOrganizations = (str: string | null | undefined): {
  */
 export const calculateAuthorStats = (papers: Paper[]): Map<string, AuthorStats> => {
   const authorMap = new Map<string, AuthorStats>()
+  // Names seen per email, used to detect email conflicts
+  const emailToNames = new Map<string, Set<string>>()
 
-  // First collect all papers for each author
+  // Collect all papers and names for each author in a single pass
   papers.forEach(paper => {
     paper.authorEmails.forEach((email, index) => {
       const name = paper.authorNames[index] || 'Unknown'
       const organization = paper.authorOrganizations[index] || ''
 
+      let names = emailToNames.get(email)
+      if (!names) {
+        names = new Set()
+        emailToNames.set(email, names)
+      }
+      names.add(paper.authorNames[index])
+
       if (!authorMap.has(email)) {
         authorMap.set(email, {
           id: email,
@@ -194,17 +203,6 @@ export const calculateAuthorStats = (papers: Paper[]): Map<string, AuthorStats>
   })
 
   // Detect email conflicts (one email with multiple different author names)
-  const emailToNames = new Map<string, Set<string>>()
-  papers.forEach(paper => {
-    paper.authorEmails.forEach((email, index) => {
-      const name = paper.authorNames[index]
-      if (!emailToNames.has(email)) {
-        emailToNames.set(email, new Set())
-      }
-      emailToNames.get(email)!.add(name)
-    })
-  })
-
   emailToNames.forEach((names, email) => {
     if (names.size > 1) {
       const author = authorMap.get(email)
@@ -6,6 +6,42 @@
 import ExcelJS from 'exceljs'
 import type { Paper, AuthorMerge, AuthorStats } from '@/store/paper-types'
 
+/**
+ * Create a lookup returning the sorted, comma separated IDs of papers
+ * that contain any email of a merge group.
+ * Paper IDs are indexed by email once so each group is resolved without
+ * rescanning all papers.
+ */
+const createLinkedPaperIdLookup = (papers: Paper[]): (merge: AuthorMerge) => string => {
+  const emailToPaperIds = new Map<string, number[]>()
+  papers.forEach(p => {
+    p.authorEmails.forEach(email => {
+      const paperIds = emailToPaperIds.get(email)
+      if (paperIds) {
+        paperIds.push(p.paperId)
+      } else {
+        emailToPaperIds.set(email, [p.paperId])
+      }
+    })
+  })
+
+  const cache = new Map<AuthorMerge, string>()
+  return (merge: AuthorMerge): string => {
+    const cached = cache.get(merge)
+    if (cached !== undefined) return cached
+
+    const relatedPaperIds = new Set<number>()
+    const allEmails = [merge.primaryEmail, ...merge.mergedEmails]
+    allEmails.forEach(email => {
+      emailToPaperIds.get(email)?.forEach(paperId => relatedPaperIds.add(paperId))
+    })
+
+    const paperIdList = Array.from(relatedPaperIds).sort((a, b) => a - b).join(', ')
+    cache.set(merge, paperIdList)
+    return paperIdList
+  }
+}
+
 /**
  * Export Papers to Excel with marking and styling
  * @param papers - Paper list
@@ -29,6 +65,8 @@ export const exportPapersToExcel = async (
     })
   })
 
+  const getLinkedPaperIdList = createLinkedPaperIdLookup(papers)
+
   // Create workbook and worksheet
   const workbook = new ExcelJS.Workbook()
   const worksheet = workbook.addWorksheet('Papers')
@@ -163,20 +201,10 @@ export const exportPapersToExcel = async (
     if (linkedAuthorEmails.length > 0) {
       const linkedAuthorsInfo = linkedAuthorEmails.map(email => {
         const merge = emailToMergeGroup.get(email)!
-        const allEmails = [merge.primaryEmail, ...merge.mergedEmails]
         const authorName = paper.authorNames[paper.authorEmails.indexOf(email)]
 
-        // Find all papers containing any of these linked emails
-        const relatedPaperIds = new Set<number>()
-        papers.forEach(p => {
-          const hasLinkedAuthor = p.authorEmails.some(e => allEmails.includes(e))
-          if (hasLinkedAuthor) {
-            relatedPaperIds.add(p.paperId)
-          }
-        })
-
-        // Convert to sorted array and format
-        const paperIdList = Array.from(relatedPaperIds).sort((a, b) => a - b).join(', ')
+        // IDs of all papers containing any of these linked emails
+        const paperIdList = getLinkedPaperIdList(merge)
         return `【(${paperIdList}) ${authorName}】`
       })
       addition = linkedAuthorsInfo.join('; ')
@@ -378,15 +406,29 @@ export const exportAuthorsToExcel = async (
     })
   })
 
+  const getLinkedPaperIdList = createLinkedPaperIdLookup(papers)
+
+  // Index papers by ID and first known organization by email
+  const paperById = new Map<number, Paper>()
+  const emailToOrganization = new Map<string, string>()
+  papers.forEach(paper => {
+    if (!paperById.has(paper.paperId)) {
+      paperById.set(paper.paperId, paper)
+    }
+    paper.authorEmails.forEach((email, idx) => {
+      // Only the first slot of an email in each paper is considered
+      if (paper.authorEmails.indexOf(email) !== idx) return
+
+      const organization = paper.authorOrganizations[idx]
+      if (organization && !emailToOrganization.has(email)) {
+        emailToOrganization.set(email, organization)
+      }
+    })
+  })
+
   // Get author organization from papers
   const getAuthorOrganization = (email: string): string => {
-    for (const paper of papers) {
-      const idx = paper.authorEmails.indexOf(email)
-      if (idx !== -1 && paper.authorOrganizations[idx]) {
-        return paper.authorOrganizations[idx]
-      }
-    }
-    return ''
+    return emailToOrganization.get(email) || ''
   }
 
   // Create workbook and worksheet
@@ -467,19 +509,9 @@ export const exportAuthorsToExcel = async (
     let addition = ''
     if (emailToMergeGroup.has(author.email)) {
       const merge = emailToMergeGroup.get(author.email)!
-      const allEmails = [merge.primaryEmail, ...merge.mergedEmails]
-
-      // Find all papers containing any of these linked emails
-      const relatedPaperIds = new Set<number>()
-      papers.forEach(p => {
-        const hasLinkedAuthor = p.authorEmails.some(e => allEmails.includes(e))
-        if (hasLinkedAuthor) {
-          relatedPaperIds.add(p.paperId)
-        }
-      })
 
-      // Convert to sorted array and format
-      const paperIdList = Array.from(relatedPaperIds).sort((a, b) => a - b).join(', ')
+      // IDs of all papers containing any of these linked emails
+      const paperIdList = getLinkedPaperIdList(merge)
       addition = `【(${paperIdList}) ${author.name}】`
     }
 
@@ -516,7 +548,7 @@ export const exportAuthorsToExcel = async (
         }
 
         // Find the paper
-        const paper = papers.find(p => p.paperId === paperId)
+        const paper = paperById.get(paperId)
         let paperRank = 0
 
         if (paper && paper.warningAuthors) {
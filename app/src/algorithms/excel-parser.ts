@@ -46,8 +46,12 @@ export const parseExcelFile = async (
   // Read file
   const buffer = await file.arrayBuffer()
 
-  // Parse Excel
-  const workbook = XLSX.read(buffer, { type: 'array' })
+  // Parse Excel (skip HTML and formula text generation, only cell values are used)
+  const workbook = XLSX.read(buffer, {
+    type: 'array',
+    cellHTML: false,
+    cellFormula: false,
+  })
   const sheetName = workbook.SheetNames[0]
   const worksheet = workbook.Sheets[sheetName]
 
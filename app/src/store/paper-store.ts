@@ -51,6 +51,16 @@ interface PaperStore {
 }
 
 
+/**
+ * Last "All" view result, keyed by the datasets array it was computed from.
+ * Datasets are replaced immutably, so merge/unmerge operations (which only
+ * change authorMerges) reuse the base statistics instead of recomputing them.
+ */
+let mergedDatasetsCache: {
+  datasets: Dataset[]
+  result: { papers: Paper[], authors: Map<string, AuthorStats> }
+} | null = null
+
 /**
  * Merge papers and authors from multiple datasets (for "All" view)
  */
@@ -59,6 +69,10 @@ const mergeDatasets = (datasets: Dataset[]): { papers: Paper[], authors: Map<str
     return { papers: [], authors: new Map() }
   }
 
+  if (mergedDatasetsCache && mergedDatasetsCache.datasets === datasets) {
+    return mergedDatasetsCache.result
+  }
+
   // Merge all papers
   const allPapers: Paper[] = []
   datasets.forEach(ds => {
@@ -71,7 +85,9 @@ const mergeDatasets = (datasets: Dataset[]): { papers: Paper[], authors: Map<str
   // Re-mark warnings
   const papersWithWarnings = markPaperWarnings(allPapers, authors)
 
-  return { papers: papersWithWarnings, authors }
+  const result = { papers: papersWithWarnings, authors }
+  mergedDatasetsCache = { datasets, result }
+  return result
 }
 
 /**